@@ -5,22 +5,18 @@ Simple Conversation class with create/read/update/delete operations.
 Uses async/await but keeps it simple.
 """
 
-import asyncio
 import uvloop
 from sqlalchemy import Column, Integer, String, JSON, DateTime
 from sqlalchemy.sql import func
-from andamios_orm.models.base import Model, Base
+from andamios_orm.models.base import Model
 
 # Initialize database
-async def init_db():
-    from andamios_orm.core import create_memory_engine
+async def init_db(engine=None):
     from andamios_orm.core.session import init_db as init_core_db
     
-    engine = create_memory_engine()
+    # run_examples.py passes one shared engine to every example; standalone
+    # runs get a fresh memory engine. Tables are created by the first Model call
     init_core_db(engine)
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
 
 # Define Conversation model exactly like legacy database
 class Conversation(Model):
@@ -37,8 +33,8 @@ class Conversation(Model):
         return f"Conversation(id={self.id}, phase='{self.phase}')"
 
 # Example usage
-async def main():
-    await init_db()
+async def main(engine=None):
+    await init_db(engine)
     
     print("🚀 Conversation CRUD Operations")
     print("=" * 35)
@@ -5,23 +5,19 @@ Simple Repository class with create/read/update/delete operations.
 Uses async/await but keeps it simple.
 """
 
-import asyncio
 import uvloop
 from sqlalchemy import Column, Integer, String, Text, DateTime
 from sqlalchemy.sql import func
-from andamios_orm.models.base import Model, Base
+from andamios_orm.models.base import Model
 from andamios_orm.core import get_session
 
 # Initialize database
-async def init_db():
-    from andamios_orm.core import create_memory_engine
+async def init_db(engine=None):
     from andamios_orm.core.session import init_db as init_core_db
     
-    engine = create_memory_engine()
+    # run_examples.py passes one shared engine to every example; standalone
+    # runs get a fresh memory engine. Tables are created by the first Model call
     init_core_db(engine)
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
 
 # Define Repository model exactly like legacy database
 class Repository(Model):
@@ -40,8 +36,8 @@ class Repository(Model):
         return f"Repository(id={self.id}, name='{self.name}')"
 
 # Example usage
-async def main():
-    await init_db()
+async def main(engine=None):
+    await init_db(engine)
     
     print("🚀 Repository CRUD Operations")
     print("=" * 32)
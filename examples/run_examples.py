@@ -11,7 +11,6 @@ Usage:
     python examples/run_examples.py --list            # List all 4 examples
 """
 
-import asyncio
 import uvloop
 import sys
 import os
@@ -21,6 +20,8 @@ from pathlib import Path
 from typing import Dict, List, Callable, Optional
 from datetime import datetime
 
+from andamios_orm.core import create_memory_engine
+
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -59,6 +60,8 @@ class ExampleRunner:
     def __init__(self):
         self.results: Dict[str, bool] = {}
         self.start_time = datetime.now()
+        # One engine shared by every example in this run
+        self.engine = create_memory_engine()
     
     async def run_example(self, name: str, config: Dict) -> bool:
         """Run a single example."""
@@ -72,7 +75,7 @@ class ExampleRunner:
             module = importlib.import_module(config["module"])
             function = getattr(module, config["function"])
             
-            await function()
+            await function(self.engine)
             
             self.results[name] = True
             print(f"✅ {name} completed successfully")
@@ -149,10 +152,6 @@ async def main():
         list_examples()
         return
     
-    # Use uvloop for better performance
-    if hasattr(uvloop, 'install'):
-        uvloop.install()
-    
     runner = ExampleRunner()
     
     print("🔧 Andamios ORM - Ultra-Simple EDD Examples Runner")
@@ -180,4 +179,5 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Run on uvloop for better performance
+    uvloop.run(main())
\ No newline at end of file
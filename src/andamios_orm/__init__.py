@@ -8,7 +8,7 @@ async/await support and uvloop optimization.
 
 from .core import create_engine, create_memory_engine, create_file_engine, sessionmaker, AsyncSession, get_session, init_db
 from .models.base import Model
-from .simple import SimpleModel, Base, save, find_by_id, find_all, delete, create_tables, init_simple_orm
+from .simple import SimpleModel, Base, save, save_all, find_by_id, find_all, delete, create_tables, init_simple_orm
 
 __version__ = "0.1.0"
 __author__ = "andresclaroavocado"
@@ -18,5 +18,5 @@ __all__ = [
     # Core API (for advanced users)
     "create_engine", "create_memory_engine", "create_file_engine", "sessionmaker", "AsyncSession", "get_session", "init_db", "Model",
     # Simple API (for easy examples)
-    "SimpleModel", "Base", "save", "find_by_id", "find_all", "delete", "create_tables", "init_simple_orm"
+    "SimpleModel", "Base", "save", "save_all", "find_by_id", "find_all", "delete", "create_tables", "init_simple_orm"
 ]
\ No newline at end of file
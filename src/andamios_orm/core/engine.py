@@ -2,15 +2,58 @@
 Database engine management for Andamios ORM - DuckDB optimized
 """
 
-import uvloop
-import asyncio
+import json
 from typing import Optional, Any, Dict
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 
+try:
+    import orjson
+except ImportError:  # optional "fast-json" extra, stdlib json is used otherwise
+    orjson = None  # type: ignore[assignment]
+
+
+# Types json.dumps rejects but orjson would encode natively are handed back,
+# so they still fail (or reach json.dumps) instead of being stored silently
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _orjson_dumps(value: Any) -> str:
+    """Serialize JSON column values with orjson, returning str like json.dumps.
+
+    Anything orjson refuses (integers wider than 64 bits, datetimes, ...)
+    goes through json.dumps, which encodes it or raises TypeError as usual.
+    Remaining differences: NaN and infinity become null, and UUIDs and
+    enums are encoded instead of rejected.
+    """
+    try:
+        return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(value)
+
+
+def _orjson_loads(value: Any) -> Any:
+    """Parse JSON column values with orjson, falling back to json.loads.
+
+    The fallback covers documents orjson rejects, such as the NaN literals
+    json.dumps writes.
+    """
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return json.loads(value)
+
 
 def create_engine(
     url: str = "duckdb+duckdb_engine:///:memory:",
     echo: bool = False,
+    fast_json: bool = False,
     **kwargs: Any
 ) -> AsyncEngine:
     """
@@ -19,22 +62,32 @@ def create_engine(
     Args:
         url: DuckDB URL (defaults to in-memory database)
         echo: Whether to echo SQL statements
+        fast_json: Encode/decode JSON columns with orjson (the "fast-json"
+            extra). Off by default because orjson stores NaN/infinity as
+            null where json.dumps keeps them
         **kwargs: Additional engine arguments
         
     Returns:
         AsyncEngine instance optimized for DuckDB
     """
-    # Ensure uvloop is set as the event loop policy for optimal performance
-    if hasattr(uvloop, 'install'):
-        uvloop.install()
-    
     # DuckDB-specific optimizations
     duckdb_kwargs: Dict[str, Any] = {
         "echo": echo,
         "future": True,  # SQLAlchemy 2.0 style
-        **kwargs
     }
     
+    # JSON columns are encoded/decoded on every write/read; orjson is faster
+    # when the caller opts in (and can still pass their own codec)
+    if fast_json:
+        if orjson is None:
+            raise ImportError(
+                "fast_json=True requires orjson: pip install 'andamios-orm[fast-json]'"
+            )
+        duckdb_kwargs["json_serializer"] = _orjson_dumps
+        duckdb_kwargs["json_deserializer"] = _orjson_loads
+    
+    duckdb_kwargs.update(kwargs)
+    
     # DuckDB doesn't use traditional connection pooling like PostgreSQL
     # Remove pool-related parameters that don't apply to DuckDB
     duckdb_kwargs.pop("pool_size", None)
@@ -7,29 +7,37 @@ from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession, async
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from .engine import create_memory_engine
+from .tables import mark_tables_created, reset_created_tables, tables_pending
 
 # Global engine and session maker - initialized automatically
 _global_engine: Optional[AsyncEngine] = None
 _global_sessionmaker: Optional[async_sessionmaker] = None
 
 
-def init_db(engine: Optional[AsyncEngine] = None) -> None:
+def init_db(engine: Optional[AsyncEngine] = None) -> AsyncEngine:
     """Initialize the global database engine and session maker.
     
     Args:
         engine: Optional engine to use. If None, creates a memory engine.
+    
+    Returns:
+        The engine backing the global session maker.
     """
     global _global_engine, _global_sessionmaker
     
     if engine is None:
         engine = create_memory_engine()
     
+    if engine is not _global_engine:
+        from ..models.base import Base
+        reset_created_tables(Base.metadata)
     _global_engine = engine
     _global_sessionmaker = async_sessionmaker(
         engine,
         class_=SQLAlchemyAsyncSession,
         expire_on_commit=False
     )
+    return engine
 
 
 async def get_session() -> SQLAlchemyAsyncSession:
@@ -39,11 +47,13 @@ async def get_session() -> SQLAlchemyAsyncSession:
     if _global_sessionmaker is None:
         init_db()
     
-    # Auto-create tables if they don't exist
+    # Auto-create tables if they don't exist, once per engine and model set
     if _global_engine is not None:
         from ..models.base import Base
-        async with _global_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        if tables_pending(Base.metadata):
+            async with _global_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            mark_tables_created(Base.metadata)
     
     return _global_sessionmaker()
 
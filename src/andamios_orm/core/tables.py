@@ -0,0 +1,37 @@
+"""
+Created-table bookkeeping for Andamios ORM
+
+Remembers which tables of a MetaData already exist on its current engine,
+so callers only run create_all() again when something changed.
+"""
+
+from typing import Any, Set
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import MetaData, Table, event
+
+# Table keys already created, per MetaData
+_created: "WeakKeyDictionary[MetaData, Set[str]]" = WeakKeyDictionary()
+
+
+def tables_pending(metadata: MetaData) -> bool:
+    """True when metadata has tables not yet created on the current engine."""
+    return not _created.get(metadata, set()).issuperset(metadata.tables)
+
+
+def mark_tables_created(metadata: MetaData) -> None:
+    """Record that create_all() just ran for every table of metadata."""
+    _created.setdefault(metadata, set()).update(metadata.tables)
+
+
+def reset_created_tables(metadata: MetaData) -> None:
+    """Forget every table of metadata, e.g. after switching engines."""
+    _created.pop(metadata, None)
+
+
+@event.listens_for(Table, "after_drop")
+def _forget_dropped_table(table: Table, connection: Any, **kw: Any) -> None:
+    # Fires for Table.drop() and for each table of MetaData.drop_all()
+    created = _created.get(table.metadata)
+    if created is not None:
+        created.discard(table.key)
@@ -4,8 +4,10 @@ Base model classes for Andamios ORM
 This module contains the base model class with Active Record pattern for simple usage.
 """
 
-from typing import Optional, Any, Dict, ClassVar, Type, List
-from sqlalchemy import Column, Integer, DateTime
+from typing import Optional, Any, Callable, Dict, ClassVar, Type, TypeVar, List, Tuple, FrozenSet
+from sqlalchemy import Column, ColumnElement, Integer, DateTime, Select, and_, bindparam, delete, insert, inspect, select, update
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.sql.dml import ReturningDelete, ReturningInsert, ReturningUpdate
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,6 +18,123 @@ from ..core import get_session
 Base = declarative_base()
 
 
+# Statements are built once per model (and per updated field set) and only
+# their parameters change between calls. Bind names carry a prefix so they
+# can never clash with a model's own column names.
+_PK_PARAM = "_andamios_pk"
+_SET_PARAM = "_andamios_set_"
+# Cap on cached UPDATE statements, one per (model, updated field set)
+_UPDATE_CACHE_SIZE = 256
+
+_R = TypeVar("_R")
+
+
+def _per_model(build: Callable[[Type["Model"]], _R]) -> Callable[[Type["Model"]], _R]:
+    """Cache build(model_class) once per mapped class."""
+    cache: Dict[Type["Model"], _R] = {}
+
+    def cached(model_class: Type["Model"]) -> _R:
+        try:
+            return cache[model_class]
+        except KeyError:
+            result = cache[model_class] = build(model_class)
+            return result
+
+    return cached
+
+
+def _pk_columns(model_class: Type["Model"]) -> Tuple[ColumnElement[Any], ...]:
+    return tuple(inspect(model_class, raiseerr=True).primary_key)
+
+
+def _pk_clause(model_class: Type["Model"]) -> ColumnElement[bool]:
+    """WHERE clause matching every primary key column, composite keys included."""
+    return and_(
+        *(
+            column == bindparam(f"{_PK_PARAM}_{position}")
+            for position, column in enumerate(_pk_columns(model_class))
+        )
+    )
+
+
+def _pk_params(model_class: Type["Model"], id: Any) -> Dict[str, Any]:
+    """Bind a primary key value (a tuple for composite keys), like session.get."""
+    columns = _pk_columns(model_class)
+    values = id if len(columns) > 1 else (id,)
+    if not isinstance(values, (tuple, list)) or len(values) != len(columns):
+        raise InvalidRequestError(
+            f"{model_class.__name__} has a {len(columns)}-column primary key; "
+            f"pass a tuple of {len(columns)} values, got {id!r}"
+        )
+    return {f"{_PK_PARAM}_{position}": value for position, value in enumerate(values)}
+
+
+@_per_model
+def _insert_returning(model_class: Type["Model"]) -> ReturningInsert[Any]:
+    return insert(model_class).returning(model_class, sort_by_parameter_order=True)
+
+
+@_per_model
+def _select_by_pk(model_class: Type["Model"]) -> Select[Any]:
+    return select(model_class).where(_pk_clause(model_class))
+
+
+_update_statements: Dict[Tuple[Type["Model"], FrozenSet[str]], ReturningUpdate[Any]] = {}
+
+
+def _update_by_pk(
+    model_class: Type["Model"], fields: FrozenSet[str]
+) -> ReturningUpdate[Any]:
+    key = (model_class, fields)
+    stmt = _update_statements.get(key)
+    if stmt is None:
+        if len(_update_statements) >= _UPDATE_CACHE_SIZE:
+            _update_statements.clear()
+        stmt = _update_statements[key] = (
+            update(model_class)
+            .where(_pk_clause(model_class))
+            .values({field: bindparam(_SET_PARAM + field) for field in fields})
+            .returning(model_class)
+            .execution_options(synchronize_session=False)
+        )
+    return stmt
+
+
+@_per_model
+def _delete_by_pk(model_class: Type["Model"]) -> ReturningDelete[Any]:
+    return (
+        delete(model_class)
+        .where(_pk_clause(model_class))
+        .returning(*_pk_columns(model_class))
+        .execution_options(synchronize_session=False)
+    )
+
+
+@_per_model
+def _column_names(model_class: Type["Model"]) -> Tuple[str, ...]:
+    """Column names of a mapped class, computed once per class."""
+    return tuple(c.name for c in model_class.__table__.columns)
+
+
+@_per_model
+def _column_attrs(model_class: Type["Model"]) -> FrozenSet[str]:
+    return frozenset(inspect(model_class, raiseerr=True).column_attrs.keys())
+
+
+def _check_kwargs(model_class: Type["Model"], rows: List[Dict[str, Any]]) -> None:
+    """Reject unknown fields like the model constructor does.
+
+    An INSERT built from plain dicts would otherwise drop them silently.
+    """
+    known = _column_attrs(model_class)
+    for row in rows:
+        for key in row:
+            if key not in known:
+                raise TypeError(
+                    f"{key!r} is an invalid keyword argument for {model_class.__name__}"
+                )
+
+
 class Model(Base):
     """Active Record base model for simple ORM usage.
     
@@ -24,58 +143,93 @@ class Model(Base):
     Note: Models should define their own id, created_at, updated_at fields to match legacy schema exactly.
     """
     __abstract__ = True
+    # When instances are flushed through a session, fetch server-generated
+    # columns (created_at, ...) with RETURNING instead of leaving them unloaded
+    __mapper_args__ = {"eager_defaults": True}
     
     @classmethod
     async def create(cls, **kwargs: Any) -> "Model":
-        """Create and persist a new model instance."""
+        """Create and persist a new model instance.
+        
+        The instance goes through the model constructor, so validators and
+        init/before_insert events run as usual.
+        """
+        instance = cls(**kwargs)
         session = await get_session()
         try:
-            instance = cls(**kwargs)
+            # eager_defaults fetches server-generated columns with RETURNING
+            # during the INSERT, so no refresh SELECT is needed
             session.add(instance)
             await session.commit()
-            await session.refresh(instance)
             return instance
         finally:
             await session.close()
     
     @classmethod
-    async def read(cls, id: int) -> Optional["Model"]:
-        """Read a model instance by ID."""
+    async def create_many(cls, rows: List[Dict[str, Any]]) -> List["Model"]:
+        """Create and persist several model instances in one transaction.
+        
+        Rows are written with one bulk INSERT ... RETURNING, which bypasses
+        the model constructor: validators and init/before_insert events do
+        not run. Use create() for models that rely on them.
+        """
+        if not rows:
+            return []
+        _check_kwargs(cls, rows)
         session = await get_session()
         try:
-            return await session.get(cls, id)
+            # One multi-row INSERT ... RETURNING instead of a flush per object
+            result = await session.scalars(_insert_returning(cls), rows)
+            instances = list(result.all())
+            await session.commit()
+            return instances
+        finally:
+            await session.close()
+    
+    @classmethod
+    async def read(cls, id: Any) -> Optional["Model"]:
+        """Read a model instance by ID (a tuple for composite primary keys)."""
+        params = _pk_params(cls, id)
+        session = await get_session()
+        try:
+            result = await session.execute(_select_by_pk(cls), params)
+            instance: Optional[Model] = result.scalar_one_or_none()
+            return instance
         finally:
             await session.close()
     
     @classmethod
-    async def update(cls, id: int, **kwargs: Any) -> Optional["Model"]:
-        """Update a model instance by ID."""
+    async def update(cls, id: Any, **kwargs: Any) -> Optional["Model"]:
+        """Update a model instance by ID (a tuple for composite primary keys)."""
+        if not kwargs:
+            return await cls.read(id)
+        _check_kwargs(cls, [kwargs])
+        params = _pk_params(cls, id)
+        params.update((_SET_PARAM + field, value) for field, value in kwargs.items())
         session = await get_session()
         try:
-            instance = await session.get(cls, id)
-            if instance:
-                for key, value in kwargs.items():
-                    setattr(instance, key, value)
-                await session.commit()
-                await session.refresh(instance)
+            # Atomic UPDATE ... RETURNING instead of SELECT, modify, flush, refresh
+            result = await session.execute(_update_by_pk(cls, frozenset(kwargs)), params)
+            instance: Optional[Model] = result.scalar_one_or_none()
+            await session.commit()
             return instance
         finally:
             await session.close()
     
     @classmethod
-    async def delete(cls, id: int) -> bool:
-        """Delete a model instance by ID."""
+    async def delete(cls, id: Any) -> bool:
+        """Delete a model instance by ID (a tuple for composite primary keys)."""
+        params = _pk_params(cls, id)
         session = await get_session()
         try:
-            instance = await session.get(cls, id)
-            if instance:
-                await session.delete(instance)
-                await session.commit()
-                return True
-            return False
+            # One DELETE ... RETURNING id instead of SELECT then DELETE
+            result = await session.execute(_delete_by_pk(cls), params)
+            deleted = result.first() is not None
+            await session.commit()
+            return deleted
         finally:
             await session.close()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
\ No newline at end of file
+        return {name: getattr(self, name) for name in _column_names(type(self))}
\ No newline at end of file
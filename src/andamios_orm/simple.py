@@ -5,31 +5,76 @@ Provides easy-to-use functions that hide session/engine complexity from users.
 This is what Grok suggested - abstract away the boilerplate setup.
 """
 
-from typing import Optional, Type, TypeVar, Any
-from sqlalchemy import Column, Integer, String, Text
+from typing import Optional, Type, TypeVar, Any, Coroutine
+from sqlalchemy import Column, Integer, String, Text, inspect, select
 from sqlalchemy.ext.declarative import declarative_base
 
-from .core import create_memory_engine, sessionmaker, AsyncSession
+from .core import create_engine, create_memory_engine, sessionmaker, AsyncSession
+from .core.tables import mark_tables_created, reset_created_tables, tables_pending
 import asyncio
+import atexit
+import threading
+import uvloop
 
 # Global setup - initialized once
 _engine = None
 _session_maker = None
+# One uvloop loop on a background thread serves every calling thread
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
 _base = declarative_base()
 
 T = TypeVar('T')
+R = TypeVar('R')
 
 def init_simple_orm(database_url: Optional[str] = None):
     """Initialize the ORM with minimal setup. Call this once at app start."""
     global _engine, _session_maker
     
     if database_url:
-        from .core import create_engine
         _engine = create_engine(database_url)
     else:
         _engine = create_memory_engine()
+    reset_created_tables(_base.metadata)
     
-    _session_maker = sessionmaker(_engine, class_=AsyncSession)
+    # Objects stay loaded after commit, so save() needs no follow-up SELECT
+    _session_maker = sessionmaker(_engine, class_=AsyncSession, expire_on_commit=False)
+
+def _stop_loop() -> None:
+    """Stop and close the background loop at interpreter exit."""
+    if _loop is None or _loop_thread is None:
+        return
+    _loop.call_soon_threadsafe(_loop.stop)
+    _loop_thread.join()
+    _loop.close()
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Start the background loop thread on first use."""
+    global _loop, _loop_thread
+    
+    with _loop_lock:
+        if _loop is None:
+            loop = uvloop.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="andamios-orm-simple", daemon=True
+            )
+            thread.start()
+            _loop, _loop_thread = loop, thread
+            atexit.register(_stop_loop)
+        return _loop
+
+def _run(coro: Coroutine[Any, Any, R]) -> R:
+    """Run a coroutine on the shared background loop and wait for its result.
+    
+    Calls from any number of threads are safe; none of them owns a loop, so
+    nothing is left behind when a calling thread exits.
+    """
+    loop = _get_loop()
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("the simple API cannot be called from inside its own event loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
 
 def get_session():
     """Get a pre-configured session - hides all the complexity."""
@@ -44,6 +89,8 @@ def get_session():
 class SimpleModel(_base):
     """Simple base model that users can inherit from."""
     __abstract__ = True
+    # Server-generated columns come back with RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
 
@@ -55,11 +102,16 @@ def create_tables():
     if _engine is None:
         init_simple_orm()
     
+    # Repeated calls are free unless new models were defined in between
+    if not tables_pending(_base.metadata):
+        return
+    
     async def _create():
         async with _engine.begin() as conn:
             await conn.run_sync(_base.metadata.create_all)
     
-    asyncio.run(_create())
+    _run(_create())
+    mark_tables_created(_base.metadata)
 
 def save(obj: Any) -> Any:
     """Save an object to database - ultra simple."""
@@ -68,12 +120,24 @@ def save(obj: Any) -> Any:
         try:
             session.add(obj)
             await session.commit()
-            await session.refresh(obj)
             return obj
         finally:
             await session.close()
     
-    return asyncio.run(_save())
+    return _run(_save())
+
+def save_all(objs: list[Any]) -> list[Any]:
+    """Save several objects in one transaction - ultra simple."""
+    async def _save_all() -> list[Any]:
+        session = get_session()
+        try:
+            session.add_all(objs)
+            await session.commit()
+            return objs
+        finally:
+            await session.close()
+    
+    return _run(_save_all())
 
 def find_by_id(model_class: Type[T], id: int) -> Optional[T]:
     """Find object by ID - ultra simple."""
@@ -84,20 +148,27 @@ def find_by_id(model_class: Type[T], id: int) -> Optional[T]:
         finally:
             await session.close()
     
-    return asyncio.run(_find())
+    return _run(_find())
 
-def find_all(model_class: Type[T]) -> list[T]:
-    """Find all objects of a type - ultra simple."""
-    async def _find_all():
-        from sqlalchemy import select
+def find_all(model_class: Type[T], limit: Optional[int] = None, offset: int = 0) -> list[T]:
+    """Find all objects of a type - ultra simple.
+    
+    Pass limit/offset to page through big tables in SQL instead of
+    loading every row.
+    """
+    async def _find_all() -> list[T]:
+        stmt = select(model_class)
+        if limit is not None or offset:
+            # Stable page boundaries need a deterministic order
+            stmt = stmt.order_by(*inspect(model_class, raiseerr=True).primary_key).limit(limit).offset(offset)
         session = get_session()
         try:
-            result = await session.execute(select(model_class))
-            return result.scalars().all()
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
         finally:
             await session.close()
     
-    return asyncio.run(_find_all())
+    return _run(_find_all())
 
 def delete(obj: Any) -> None:
     """Delete an object - ultra simple."""
@@ -109,7 +180,7 @@ def delete(obj: Any) -> None:
         finally:
             await session.close()
     
-    return asyncio.run(_delete())
+    return _run(_delete())
 
 # Export the base for user models
 Base = _base
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Integration tests for JSON column storage
+
+Runs against a real SQLite database through aiosqlite, using engines built
+by create_engine so its JSON codec settings apply.
+"""
+
+import math
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import JSON, Column, Integer, MetaData, Table, select
+from sqlalchemy.exc import StatementError
+
+from andamios_orm.core import create_engine
+from andamios_orm.core.engine import orjson
+
+metadata = MetaData()
+documents = Table(
+    "json_documents",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("body", JSON),
+)
+
+
+async def _round_trip(engine, body):
+    async with engine.begin() as conn:
+        await conn.execute(documents.insert(), {"id": 1, "body": body})
+        return (await conn.execute(select(documents.c.body))).scalar_one()
+
+
+@pytest_asyncio.fixture
+async def default_engine(tmp_path):
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'json.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+class TestDefaultJsonStorage:
+    """Without fast_json, JSON columns keep json.dumps semantics."""
+
+    @pytest.mark.asyncio
+    async def test_nan_is_stored_as_nan(self, default_engine):
+        body = await _round_trip(default_engine, {"x": float("nan")})
+
+        assert math.isnan(body["x"])
+
+    @pytest.mark.asyncio
+    async def test_datetime_is_rejected(self, default_engine):
+        with pytest.raises(StatementError) as excinfo:
+            await _round_trip(default_engine, {"when": datetime(2024, 1, 1)})
+
+        assert isinstance(excinfo.value.orig, TypeError)
+
+
+@pytest.mark.skipif(orjson is None, reason="orjson not installed")
+class TestFastJsonStorage:
+    """fast_json=True stores plain JSON values the same way."""
+
+    @pytest_asyncio.fixture
+    async def fast_engine(self, tmp_path):
+        engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'fast.db'}", fast_json=True)
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+        yield engine
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, fast_engine):
+        body = {"name": "doc", "tags": ["a", "b"], "big": 2**70, "nested": {"n": 1.5}}
+
+        assert await _round_trip(fast_engine, body) == body
+
+    @pytest.mark.asyncio
+    async def test_datetime_is_rejected(self, fast_engine):
+        with pytest.raises(StatementError) as excinfo:
+            await _round_trip(fast_engine, {"when": datetime(2024, 1, 1)})
+
+        assert isinstance(excinfo.value.orig, TypeError)
@@ -0,0 +1,292 @@
+"""
+Integration tests for the Active Record Model
+
+Runs against a real SQLite database file through aiosqlite, wired in with
+init_db(engine).
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, DateTime, Integer, String, event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import validates
+from sqlalchemy.sql import func
+
+from andamios_orm.core import session as session_module
+from andamios_orm.core.session import get_session, init_db
+from andamios_orm.models.base import Base, Model
+
+
+class Task(Model):
+    __tablename__ = "model_tasks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String(100), nullable=False)
+    status = Column(String(50), default="todo")
+    created_at = Column(DateTime, server_default=func.now())
+
+
+class Setting(Model):
+    """Columns named like the statement parameters, keyed by a non-id column."""
+
+    __tablename__ = "model_settings"
+
+    code = Column(String(20), primary_key=True)
+    pk = Column(String(50))
+    name = Column(String(50))
+    new_name = Column(String(50))
+
+
+class Pair(Model):
+    """Composite primary key."""
+
+    __tablename__ = "model_pairs"
+
+    a = Column(Integer, primary_key=True)
+    b = Column(Integer, primary_key=True)
+    note = Column(String(50))
+
+
+class Tag(Model):
+    """Model with a validator, which create() must run."""
+
+    __tablename__ = "model_tags"
+
+    id = Column(Integer, primary_key=True)
+    label = Column(String(50), nullable=False)
+
+    @validates("label")
+    def normalize_label(self, key, value):
+        return value.strip().lower()
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path):
+    """Point the global session at a fresh database file."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'model.db'}")
+    init_db(engine)
+    yield engine
+    await engine.dispose()
+
+
+class TestCreateMany:
+    """create_many inserts a batch with one statement."""
+
+    @pytest.mark.asyncio
+    async def test_returns_rows_in_input_order(self, db):
+        titles = [f"task {i}" for i in range(20)]
+
+        tasks = await Task.create_many([{"title": title} for title in titles])
+
+        assert [task.title for task in tasks] == titles
+        ids = [task.id for task in tasks]
+        assert ids == sorted(ids)
+
+    @pytest.mark.asyncio
+    async def test_applies_defaults(self, db):
+        tasks = await Task.create_many([{"title": "a"}, {"title": "b", "status": "done"}])
+
+        assert [task.status for task in tasks] == ["todo", "done"]
+        assert all(task.created_at is not None for task in tasks)
+
+        stored = await Task.read(tasks[0].id)
+        assert stored.status == "todo"
+        assert stored.created_at == tasks[0].created_at
+
+    @pytest.mark.asyncio
+    async def test_empty_list(self, db):
+        assert await Task.create_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_field_raises(self, db):
+        with pytest.raises(TypeError, match="titel"):
+            await Task.create_many([{"title": "ok"}, {"titel": "typo"}])
+
+        assert await Task.read(1) is None
+
+
+class TestCreate:
+    """create inserts one row with INSERT ... RETURNING."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_field_raises(self, db):
+        with pytest.raises(TypeError, match="bogus"):
+            await Task.create(title="a", bogus=1)
+
+        assert await Task.read(1) is None
+
+    @pytest.mark.asyncio
+    async def test_runs_validators_and_loads_defaults(self, db):
+        tag = await Tag.create(label="  Python ")
+        task = await Task.create(title="defaults")
+
+        assert tag.label == "python"
+        assert (await Tag.read(tag.id)).label == "python"
+        assert task.status == "todo"
+        assert task.created_at is not None
+
+
+class TestUpdate:
+    """update is a single UPDATE ... RETURNING."""
+
+    @pytest.mark.asyncio
+    async def test_updates_and_returns_row(self, db):
+        task = await Task.create(title="draft")
+
+        updated = await Task.update(task.id, title="final", status="done")
+
+        assert (updated.id, updated.title, updated.status) == (task.id, "final", "done")
+        stored = await Task.read(task.id)
+        assert (stored.title, stored.status) == ("final", "done")
+
+    @pytest.mark.asyncio
+    async def test_missing_id_returns_none(self, db):
+        assert await Task.update(999, title="ghost") is None
+
+    @pytest.mark.asyncio
+    async def test_no_fields_returns_current_row(self, db):
+        task = await Task.create(title="same")
+
+        unchanged = await Task.update(task.id)
+
+        assert unchanged.to_dict() == task.to_dict()
+        assert await Task.update(999) is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_field_raises(self, db):
+        task = await Task.create(title="keep")
+
+        with pytest.raises(TypeError, match="bogus"):
+            await Task.update(task.id, bogus=1)
+
+        assert (await Task.read(task.id)).title == "keep"
+
+
+class TestDelete:
+    """delete is a single DELETE ... RETURNING."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_existing_row(self, db):
+        task = await Task.create(title="gone")
+
+        assert await Task.delete(task.id) is True
+        assert await Task.read(task.id) is None
+
+    @pytest.mark.asyncio
+    async def test_missing_id_returns_false(self, db):
+        assert await Task.delete(999) is False
+
+
+class TestCreateTablesGuard:
+    """get_session runs create_all once per engine, and again after a drop."""
+
+    @pytest.fixture
+    def create_all_calls(self):
+        calls = []
+
+        def record(target, connection, **kw):
+            calls.append(target)
+
+        event.listen(Base.metadata, "before_create", record)
+        yield calls
+        event.remove(Base.metadata, "before_create", record)
+
+    @pytest.mark.asyncio
+    async def test_create_all_runs_once_per_engine(self, db, create_all_calls):
+        for _ in range(3):
+            session = await get_session()
+            await session.close()
+
+        assert len(create_all_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_new_engine_creates_tables_again(self, db, tmp_path, create_all_calls):
+        await Task.create(title="first engine")
+        other = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'other.db'}")
+        try:
+            init_db(other)
+            await Task.create(title="second engine")
+        finally:
+            await other.dispose()
+
+        assert len(create_all_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_drop_all_lets_tables_be_recreated(self, db, create_all_calls):
+        await Task.create(title="before drop")
+        async with db.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+
+        task = await Task.create(title="after drop")
+
+        assert task.id == 1
+        assert len(create_all_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_single_table_drop_lets_it_be_recreated(self, db, create_all_calls):
+        await Task.create(title="before drop")
+        async with db.begin() as conn:
+            await conn.run_sync(Task.__table__.drop)
+
+        task = await Task.create(title="after drop")
+
+        assert task.id == 1
+        assert len(create_all_calls) == 2
+
+
+class TestPrimaryKeyStatements:
+    """read/update/delete work on any primary key and any column names."""
+
+    @pytest.mark.asyncio
+    async def test_column_names_do_not_clash_with_parameters(self, db):
+        await Setting.create(code="theme", name="light")
+
+        updated = await Setting.update("theme", name="dark")
+        assert updated.name == "dark"
+
+        updated = await Setting.update("theme", pk="p", new_name="q")
+        assert (updated.pk, updated.name, updated.new_name) == ("p", "dark", "q")
+
+    @pytest.mark.asyncio
+    async def test_non_id_primary_key(self, db):
+        await Setting.create(code="lang", name="en")
+
+        assert (await Setting.read("lang")).name == "en"
+        assert await Setting.delete("lang") is True
+        assert await Setting.read("lang") is None
+
+    @pytest.mark.asyncio
+    async def test_composite_primary_key_matches_every_column(self, db):
+        await Pair.create_many([{"a": 1, "b": 1}, {"a": 1, "b": 2, "note": "keep"}])
+
+        assert (await Pair.update((1, 1), note="changed")).note == "changed"
+        assert await Pair.delete((1, 1)) is True
+        assert await Pair.read((1, 1)) is None
+        assert (await Pair.read((1, 2))).note == "keep"
+
+    @pytest.mark.asyncio
+    async def test_composite_primary_key_rejects_partial_id(self, db):
+        await Pair.create(a=1, b=1)
+
+        for call in (Pair.read(1), Pair.update(1, note="x"), Pair.delete(1)):
+            with pytest.raises(InvalidRequestError):
+                await call
+
+        assert (await Pair.read((1, 1))) is not None
+
+
+class TestInitDb:
+    """init_db() without an engine always starts from a fresh database."""
+
+    def test_without_engine_replaces_current_engine(self, db, monkeypatch):
+        monkeypatch.setattr(
+            session_module,
+            "create_memory_engine",
+            lambda: create_async_engine("sqlite+aiosqlite://"),
+        )
+
+        fresh = init_db()
+
+        assert fresh is not db
+        assert init_db() is not fresh
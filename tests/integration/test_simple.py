@@ -0,0 +1,142 @@
+"""
+Integration tests for the simple synchronous API
+
+Runs against a real SQLite database file through aiosqlite.
+"""
+
+import os
+import threading
+
+import pytest
+from sqlalchemy import Column, String
+
+from andamios_orm import simple
+
+
+class Note(simple.SimpleModel):
+    __tablename__ = "simple_notes"
+
+    title = Column(String(100), nullable=False)
+
+
+@pytest.fixture
+def simple_db(tmp_path):
+    """Point the simple API at a fresh database file."""
+    simple.init_simple_orm(f"sqlite+aiosqlite:///{tmp_path / 'simple.db'}")
+    simple.create_tables()
+    yield
+
+
+class TestSimpleThreads:
+    """The simple API is called from plain threads in sync code."""
+
+    def test_save_from_several_threads(self, simple_db):
+        """Every thread gets its own loop, so concurrent calls all succeed."""
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(10):
+                    simple.save(Note(title=f"{n}-{i}"))
+            except Exception as exc:  # collected and asserted below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(simple.find_all(Note)) == 40
+
+    @pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc")
+    def test_short_lived_threads_release_resources(self, simple_db):
+        """Finished threads leave no event loops, file descriptors or threads."""
+        simple.find_all(Note)  # start the shared loop before measuring
+        fds_before = len(os.listdir("/proc/self/fd"))
+        threads_before = threading.active_count()
+
+        for _ in range(50):
+            thread = threading.Thread(target=simple.find_all, args=(Note,))
+            thread.start()
+            thread.join()
+
+        assert threading.active_count() == threads_before
+        assert len(os.listdir("/proc/self/fd")) <= fds_before + 5
+
+
+class TestSimpleFindAll:
+    """find_all pages through rows in primary key order."""
+
+    def test_find_all_without_paging_returns_every_row(self, simple_db):
+        for i in range(5):
+            simple.save(Note(title=f"note {i}"))
+
+        assert len(simple.find_all(Note)) == 5
+
+    def test_find_all_with_limit_and_offset(self, simple_db):
+        notes = [simple.save(Note(title=f"note {i}")) for i in range(5)]
+
+        page = simple.find_all(Note, limit=2, offset=1)
+
+        assert [note.id for note in page] == [notes[1].id, notes[2].id]
+
+    def test_find_all_offset_past_the_end_is_empty(self, simple_db):
+        simple.save(Note(title="only"))
+
+        assert simple.find_all(Note, limit=10, offset=5) == []
+
+
+class TestSimpleSaveAll:
+    """save_all persists a batch in one transaction."""
+
+    def test_save_all_assigns_ids(self, simple_db):
+        notes = simple.save_all([Note(title="a"), Note(title="b"), Note(title="c")])
+
+        assert [note.title for note in notes] == ["a", "b", "c"]
+        assert all(note.id is not None for note in notes)
+        assert simple.find_by_id(Note, notes[1].id).title == "b"
+
+    def test_save_all_empty_list(self, simple_db):
+        assert simple.save_all([]) == []
+        assert simple.find_all(Note) == []
+
+
+class TestSimpleSave:
+    """Saved objects stay usable after their session has closed."""
+
+    def test_saved_object_keeps_its_values(self, simple_db):
+        note = simple.save(Note(title="kept"))
+
+        assert note.id is not None
+        assert note.title == "kept"
+        assert simple.find_by_id(Note, note.id).title == "kept"
+
+
+class TestSimpleCreateTables:
+    """create_tables skips known tables but recreates dropped ones."""
+
+    def test_create_tables_after_drop_all(self, simple_db):
+        simple.save(Note(title="before drop"))
+
+        async def drop_all():
+            async with simple._engine.begin() as conn:
+                await conn.run_sync(simple.Base.metadata.drop_all)
+
+        simple._run(drop_all())
+        simple.create_tables()
+
+        assert simple.save(Note(title="after drop")).id == 1
+
+    def test_create_tables_after_single_table_drop(self, simple_db):
+        simple.save(Note(title="before drop"))
+
+        async def drop_notes():
+            async with simple._engine.begin() as conn:
+                await conn.run_sync(Note.__table__.drop)
+
+        simple._run(drop_notes())
+        simple.create_tables()
+
+        assert simple.save(Note(title="after drop")).id == 1
@@ -0,0 +1,53 @@
+"""
+Unit tests for the engine's JSON column codec
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from andamios_orm.core import engine
+
+needs_orjson = pytest.mark.skipif(engine.orjson is None, reason="orjson not installed")
+
+
+class TestCreateEngineJsonCodec:
+    """orjson is only used when the caller opts in."""
+
+    def test_stdlib_json_by_default(self):
+        async_engine = engine.create_engine("sqlite+aiosqlite://")
+
+        assert async_engine.dialect._json_serializer is None
+        assert async_engine.dialect._json_deserializer is None
+
+    @needs_orjson
+    def test_fast_json_uses_orjson_codec(self):
+        async_engine = engine.create_engine("sqlite+aiosqlite://", fast_json=True)
+
+        assert async_engine.dialect._json_serializer is engine._orjson_dumps
+        assert async_engine.dialect._json_deserializer is engine._orjson_loads
+
+
+@needs_orjson
+class TestOrjsonCodec:
+    """The orjson codec falls back to stdlib json where orjson refuses."""
+
+    def test_dumps_returns_str(self):
+        encoded = engine._orjson_dumps({"a": [1, 2], 3: "x"})
+
+        assert json.loads(encoded) == {"a": [1, 2], "3": "x"}
+
+    def test_dumps_big_int_falls_back(self):
+        value = {"big": 2**70}
+
+        assert engine._orjson_dumps(value) == json.dumps(value)
+
+    def test_dumps_rejects_datetime_like_json_dumps(self):
+        with pytest.raises(TypeError):
+            engine._orjson_dumps({"when": datetime(2024, 1, 1)})
+
+    def test_loads_nan_falls_back(self):
+        loaded = engine._orjson_loads(json.dumps({"x": float("nan")}))
+
+        assert loaded["x"] != loaded["x"]